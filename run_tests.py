@@ -8,45 +8,60 @@ not installed.
 """
 import importlib
 import inspect
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
-def run_tests_module(module_name: str) -> int:
+def run_tests_module(module_name: str) -> list[tuple[str, str]]:
+    """Run every test function in one module; return (status_line, status) pairs.
+
+    This is the unit of work dispatched to worker processes, so it returns
+    result lines instead of printing — the parent aggregates and prints in a
+    deterministic order.
+    """
     module = importlib.import_module(module_name)
     functions = [
         (name, fn)
         for name, fn in inspect.getmembers(module, inspect.isfunction)
         if name.startswith("test_")
     ]
-    fail_count = 0
+    results = []
     for name, fn in functions:
         try:
             fn()
-            print(f"PASS: {module_name}.{name}")
+            results.append((f"PASS: {module_name}.{name}", "pass"))
         except AssertionError as e:
-            fail_count += 1
-            print(f"FAIL: {module_name}.{name} -> {e}")
+            results.append((f"FAIL: {module_name}.{name} -> {e}", "fail"))
         except Exception as e:
-            fail_count += 1
-            print(f"ERROR: {module_name}.{name} -> {e}")
-    return fail_count
+            results.append((f"ERROR: {module_name}.{name} -> {e}", "fail"))
+    return results
 
 
 def discover_and_run_tests(tests_dir: str = "tests") -> int:
     """Discover test modules under the `tests` package and run them.
 
-    Loads any file named `test_*.py` in the `tests` directory.
+    Loads any file named `test_*.py` in the `tests` directory. Modules run in
+    parallel, one worker process each, so independent modules don't serialize
+    behind each other's imports and test bodies.
     """
     tests_path = Path(tests_dir)
     if not tests_path.exists():
         print("No tests directory found")
         return 0
 
+    module_names = [f"{tests_dir}.{p.stem}" for p in sorted(tests_path.glob("test_*.py"))]
+    if not module_names:
+        return 0
+
     total_failures = 0
-    for p in sorted(tests_path.glob("test_*.py")):
-        module_name = f"{tests_dir}.{p.stem}"
-        total_failures += run_tests_module(module_name)
+    with ProcessPoolExecutor() as ex:
+        for module_results in ex.map(run_tests_module, module_names):
+            for line, status in module_results:
+                print(line)
+                if status != "pass":
+                    total_failures += 1
     return total_failures
 
 
@@ -59,4 +74,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
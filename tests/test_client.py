@@ -28,6 +28,16 @@ def test_analyze_text_basic_entities_and_sentiment():
     assert isinstance(res["sentiment"]["score"], float)
 
 
+def test_analyze_texts_batch():
+    client = ClinicalAssistantADK()
+    texts = ["Patient improved.", "Fever and cough worsening."]
+    results = client.analyze_texts(texts)
+    assert len(results) == 2
+    # Each batch entry should match the scalar API
+    for text, res in zip(texts, results):
+        assert res == client.analyze_text(text)
+
+
 def test_summarize_short_text():
     client = ClinicalAssistantADK()
     s = "Line one. Line two. Line three."
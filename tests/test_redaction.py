@@ -23,6 +23,19 @@ def test_redact_simple_name():
     assert redacted.count("[REDACTED_NAME]") >= 2
 
 
+def test_redact_phi_batch_matches_scalar():
+    client = ClinicalAssistantADK()
+    texts = ["MRN: 123456789", "Dr. John Doe was seen on 1980-05-12."]
+    assert client.redact_phi_batch(texts) == [client.redact_phi(t) for t in texts]
+
+
+def test_redact_phi_fast_matches_scalar():
+    client = ClinicalAssistantADK()
+    text = "Dr. John Doe, MRN 123456789, was seen on 1980-05-12."
+    # Equivalent output whether or not the hyperscan accelerator is installed
+    assert client.redact_phi_fast(text) == client.redact_phi(text)
+
+
 def test_redact_keeps_non_phi():
     client = ClinicalAssistantADK()
     text = "The patient improved. Follow-up in 2 weeks."